@@ -0,0 +1,62 @@
+import argparse
+import contextlib
+import os
+import sys
+
+# pygame prints a banner to stdout on import, which would corrupt raw frames written there
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.game.direction import Direction  # noqa: E402
+from src.game.render import init_headless, render_game, PngFrameWriter, RawFrameWriter  # noqa: E402
+from src.game.stats import StatsStore  # noqa: E402
+
+MOVE_KEYS = {
+    "L": Direction.LEFT,
+    "R": Direction.RIGHT,
+    "U": Direction.UP,
+    "D": Direction.DOWN
+}
+
+
+def parse_moves(moves):
+    return [MOVE_KEYS[key] for key in moves.upper() if key in MOVE_KEYS]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render 2048 games offscreen to frames")
+    parser.add_argument("--games", type=int, default=1, help="number of games to render")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--moves", help="replay these moves (L, R, U, D) instead of playing randomly")
+    parser.add_argument("--max-moves", type=int, help="stop each game after this many moves")
+    parser.add_argument("--stats", help="record finished games in this stats database")
+    parser.add_argument("--format", choices=["png", "raw"], default="png")
+    parser.add_argument("--out", default="frames", help="PNG output directory, or - for raw RGB on stdout")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    window, font = init_headless()
+    moves = parse_moves(args.moves) if args.moves else None
+    stats = StatsStore(args.stats) if args.stats else None
+
+    if args.format == "raw":
+        output = contextlib.nullcontext(sys.stdout.buffer) if args.out == "-" else open(args.out, "wb")
+        with output as stream, RawFrameWriter(stream, window.get_size()) as writer:
+            for game_number in range(args.games):
+                render_game(window, font, writer, moves, args.seed + game_number, args.max_moves, stats)
+    else:
+        for game_number in range(args.games):
+            seed = args.seed + game_number
+            with PngFrameWriter(os.path.join(args.out, f"game_{seed:06d}"), window.get_size()) as writer:
+                render_game(window, font, writer, moves, seed, args.max_moves, stats)
+
+    if stats:
+        stats.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
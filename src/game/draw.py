@@ -5,34 +5,87 @@ from src.utils.colors import Colors
 
 
 def draw_grid(window):
+    width, height = window.get_size()
+    tile_width, tile_height = width // conf.game.cols, height // conf.game.rows
+
     for row in range(1, conf.game.rows):
-        y = row * conf.tile.height
+        y = row * tile_height
         pygame.draw.line(
             window,
             Colors.outline.value(),
             (0, y),
-            (conf.window.width, y),
+            (width, y),
             conf.border.width
         )
 
     for col in range(1, conf.game.cols):
-        x = col * conf.tile.width
+        x = col * tile_width
         pygame.draw.line(
             window,
             Colors.outline.value(),
             (x, 0),
-            (x, conf.window.height),
+            (x, height),
             conf.border.width
         )
 
     pygame.draw.rect(
         window,
         Colors.outline.value(),
-        (0, 0, conf.window.width, conf.window.height),
+        (0, 0, width, height),
         conf.border.width
     )
 
 
+class BoardLayer:
+
+    def __init__(self):
+        self.key = None
+        self.surface = None
+        self.cell_rects = []
+
+    def get(self, window):
+        # Everything the baked layer is drawn from, so any change to it rebuilds the layer
+        key = (
+            window.get_size(),
+            conf.game.rows,
+            conf.game.cols,
+            conf.border.width
+        )
+        if key != self.key:
+            self.__bake(window)
+            self.key = key
+        return self
+
+    def __bake(self, window):
+        width, height = window.get_size()
+        self.surface = pygame.Surface((width, height), 0, window)
+        self.surface.fill(Colors.background.value())
+        draw_grid(self.surface)
+
+        self.cell_rects = [
+            pygame.Rect(left, top, right - left, bottom - top)
+            for top, bottom in self.__cell_spans(conf.game.rows, height // conf.game.rows, height)
+            for left, right in self.__cell_spans(conf.game.cols, width // conf.game.cols, width)
+        ]
+
+    @staticmethod
+    def __cell_spans(count, size, total):
+        # Inner edges of each cell, matching the pixels pygame.draw.line covers in draw_grid
+        width = conf.border.width
+        starts = [width] + [index * size - (width - 1) // 2 + width for index in range(1, count)]
+        ends = [index * size - (width - 1) // 2 for index in range(1, count)] + [total - width]
+        return list(zip(starts, ends))
+
+    def tile_rect(self, tile):
+        # Sized from the cell the move started in, so a tile never resizes while it slides
+        row, col = divmod(tile.origin, conf.game.cols)
+        rect = self.cell_rects[tile.origin]
+        return rect.move(tile.x - col * conf.tile.width, tile.y - row * conf.tile.height)
+
+
+board = BoardLayer()
+
+
 def draw_lost(window, font):
     # Blur the screen
     surface = pygame.Surface(window.get_size())
@@ -85,15 +138,16 @@ def draw_lost(window, font):
     )
 
 
-def draw(window, font, tiles, game_over=False):
-    window.fill(Colors.background.value())
+def draw(window, font, tiles, game_over=False, update=True):
+    # Background and grid are baked once per window size; tiles are drawn inside their cells
+    layer = board.get(window)
+    window.blit(layer.surface, (0, 0))
 
     for tile in tiles.values():
-        tile.draw(window, font)
-
-    draw_grid(window)
+        tile.draw(window, font, layer.tile_rect(tile))
 
     if game_over:
         draw_lost(window, font)
 
-    pygame.display.update()
+    if update:
+        pygame.display.update()
@@ -1,10 +1,12 @@
 import itertools
 import pygame
 import random
+import time
 
 from src.game.direction import Direction
 from src.utils.config import conf
 from src.game.draw import draw
+from src.game.stats import GameRecord
 from src.game.tile import Tile, get_random_position, generate_tiles, get_position_number
 
 
@@ -63,11 +65,18 @@ def move_check(direction: Direction):
 
 class Game:
 
-    def __init__(self, window, font, clock, tiles):
+    def __init__(self, window, font, clock, tiles, on_draw=None, seed=None):
         self.window = window
         self.font = font
         self.clock = clock
         self.tiles = tiles
+        self.on_draw = on_draw
+        self.seed = seed
+        self.random = random.Random(seed)
+
+        self.score = 0
+        self.moves = 0
+        self.started_at = time.monotonic()
 
     def get_next_tile(self, tile: Tile, direction: Direction):
         row, col = tile.row, tile.col
@@ -97,6 +106,7 @@ class Game:
             Direction.DOWN: (0, conf.move.velocity, True, False)
         }
         dx, dy, reverse, ceil = directions[direction]
+        self.moves += 1
 
         while updated:
             self.clock.tick(conf.game.fps)
@@ -116,6 +126,7 @@ class Game:
                         tile.move(dx, dy)
                     else:
                         next_tile.value *= 2
+                        self.score += next_tile.value
                         tiles_to_remove.append(tile)
                         blocked.add(tile)
                         blocked.add(next_tile)
@@ -132,14 +143,17 @@ class Game:
 
             self.update_tiles(sorted_tiles)
 
+        for tile in self.tiles.values():
+            tile.origin = tile.position_number
+
         return self.has_lost()
 
     def has_lost(self):
         if len(self.tiles) == 16:
             return not self.__has_possible_moves()
 
-        row, col, position_number = get_random_position(self.tiles)
-        self.tiles[position_number] = Tile(random.choice([2, 4]), row, col)
+        row, col, position_number = get_random_position(self.tiles, self.random)
+        self.tiles[position_number] = Tile(self.random.choice([2, 4]), row, col)
         return False
 
     def __has_possible_moves(self):
@@ -166,12 +180,28 @@ class Game:
         for tile in sorted_tiles:
             self.tiles[tile.position_number] = tile
 
-        draw(self.window, self.font, self.tiles)
+        self.render()
+
+    def render(self, game_over=False):
+        # Offscreen windows are handed to on_draw instead of being flipped to the display
+        draw(self.window, self.font, self.tiles, game_over, update=self.on_draw is None)
+        if self.on_draw:
+            self.on_draw(self.window)
 
     def __str__(self):
         return str(to_grid(self.tiles))
 
 
+def new_game(window, font, clock, on_draw=None, seed=None):
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    # Each game draws from its own generator, so the seed plus the moves played reproduce it
+    game = Game(window, font, clock, {}, on_draw, seed)
+    game.tiles = generate_tiles(game.random)
+    return game
+
+
 def game_event_helper(game, event):
     if event.type == pygame.KEYDOWN:
         if event.key in [pygame.K_LEFT, pygame.K_a]:
@@ -186,33 +216,50 @@ def game_event_helper(game, event):
     return False
 
 
-def game_loop(window, font, clock):
+REDRAW_EVENTS = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED}
+
+
+def get_events(redraw):
+    # Sleep until something happens instead of polling, unless a frame is still owed
+    if conf.game.event_driven and not redraw:
+        return [pygame.event.wait()] + pygame.event.get()
+    return pygame.event.get()
+
+
+def game_loop(window, font, clock, stats=None):
     run = True
     has_lost = False
+    redraw = True
 
-    tiles = generate_tiles()
-    game = Game(window, font, clock, tiles)
+    game = new_game(window, font, clock)
 
     while run:
         clock.tick(conf.game.fps)
 
-        for event in pygame.event.get():
+        for event in get_events(redraw):
             if event.type == pygame.QUIT:
                 run = False
                 break
 
+            if event.type in REDRAW_EVENTS:
+                redraw = True
+
             if event.type == pygame.KEYDOWN:
+                redraw = True
                 if not has_lost:
                     has_lost = game_event_helper(game, event)
+                    if has_lost and stats:
+                        stats.record(GameRecord.from_game(game))
                 else:
                     if event.key == pygame.K_r:
-                        tiles = generate_tiles()
-                        game = Game(window, font, clock, tiles)
+                        game = new_game(window, font, clock)
                         has_lost = False
                     if event.key == pygame.K_q:
                         run = False
                         break
 
-        draw(window, font, tiles, has_lost)
+        if run and (redraw or not conf.game.event_driven):
+            draw(window, font, game.tiles, has_lost)
+            redraw = False
 
     pygame.quit()
@@ -0,0 +1,129 @@
+import os
+import queue
+import random
+import threading
+from abc import ABC, abstractmethod
+
+import pygame
+
+from src.game.direction import Direction
+from src.game.engine import new_game
+from src.game.stats import GameRecord
+from src.utils.config import conf
+
+
+def init_headless():
+    # The dummy driver lets fonts and surfaces work without opening a window
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    font = pygame.font.SysFont(conf.font.name, conf.font.size, bold=True)
+    window = pygame.Surface((conf.window.width, conf.window.height))
+    return window, font
+
+
+class NullClock:
+
+    def tick(self, framerate=0):
+        return 0
+
+
+class FrameWriter(threading.Thread, ABC):
+
+    def __init__(self, size, max_pending=64):
+        super().__init__(daemon=True)
+        self.size = size
+        self.frames = queue.Queue(maxsize=max_pending)
+        self.count = 0
+        self.error = None
+
+    def write(self, surface):
+        if self.error:
+            raise self.error
+        self.frames.put(pygame.image.tobytes(surface, "RGB"))
+
+    def run(self):
+        while (frame := self.frames.get()) is not None:
+            # Keep draining after a failure so the renderer never blocks on a full queue
+            if self.error is None:
+                try:
+                    self.encode(frame, self.count)
+                except Exception as error:
+                    self.error = error
+            self.count += 1
+
+    @abstractmethod
+    def encode(self, frame, index):
+        pass
+
+    def finish(self):
+        pass
+
+    def close(self):
+        self.frames.put(None)
+        self.join()
+        self.finish()
+
+        if self.error:
+            raise self.error
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RawFrameWriter(FrameWriter):
+
+    def __init__(self, stream, size, max_pending=64):
+        super().__init__(size, max_pending)
+        self.stream = stream
+
+    def encode(self, frame, index):
+        self.stream.write(frame)
+
+    def finish(self):
+        self.stream.flush()
+
+
+class PngFrameWriter(FrameWriter):
+
+    def __init__(self, directory, size, max_pending=64):
+        super().__init__(size, max_pending)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def encode(self, frame, index):
+        surface = pygame.image.frombytes(frame, self.size, "RGB")
+        pygame.image.save(surface, os.path.join(self.directory, f"frame_{index:06d}.png"))
+
+
+def random_moves(rng=random):
+    directions = list(Direction)
+    while True:
+        yield rng.choice(directions)
+
+
+def render_game(window, font, writer, moves=None, seed=None, max_moves=None, stats=None):
+    game = new_game(window, font, NullClock(), writer.write, seed)
+    game.render()
+
+    has_lost = False
+    for count, direction in enumerate(moves or random_moves(game.random)):
+        if max_moves is not None and count >= max_moves:
+            break
+
+        has_lost = game.move_tiles(direction)
+        if has_lost:
+            game.render(game_over=True)
+            if stats:
+                stats.record(GameRecord.from_game(game))
+            break
+
+        # move_tiles spawns the next tile after its last animation frame
+        game.render()
+
+    return game, has_lost
@@ -0,0 +1,162 @@
+import math
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field, astuple
+
+from src.utils.config import conf
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    max_tile INTEGER NOT NULL,
+    moves INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_score ON games (score);
+CREATE INDEX IF NOT EXISTS games_max_tile_score ON games (max_tile, score);
+"""
+
+COLUMNS = "score, max_tile, moves, duration, seed, finished_at"
+
+
+@dataclass
+class GameRecord:
+    score: int
+    max_tile: int
+    moves: int
+    duration: float
+    seed: int = None
+    finished_at: float = field(default_factory=time.time)
+
+    @staticmethod
+    def from_game(game) -> "GameRecord":
+        return GameRecord(
+            game.score,
+            max(tile.value for tile in game.tiles.values()),
+            game.moves,
+            time.monotonic() - game.started_at,
+            game.seed
+        )
+
+
+@dataclass
+class MaxTileSummary:
+    max_tile: int
+    games: int
+    best_score: int
+    average_score: float
+
+
+class StatsStore:
+
+    def __init__(self, path, batch_size=None, flush_interval=None):
+        self.path = path
+        self.batch_size = batch_size or conf.stats.batch_size
+        self.flush_interval = flush_interval or conf.stats.flush_interval
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+        self.pending = queue.Queue()
+        self.error = None
+        self.writer = threading.Thread(target=self.__write_batches, daemon=True)
+        self.writer.start()
+
+    def record(self, record: GameRecord):
+        # Only enqueues; the writer thread owns all inserts so finishing a game never waits on disk
+        self.pending.put(record)
+
+    def flush(self):
+        self.pending.join()
+
+    def close(self):
+        self.pending.put(None)
+        self.writer.join()
+        self.connection.close()
+
+        if self.error:
+            raise self.error
+
+    def __next_batch(self):
+        batch = [self.pending.get()]
+        deadline = time.monotonic() + self.flush_interval
+
+        while batch[-1] is not None and len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.pending.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def __write_batches(self):
+        connection = sqlite3.connect(self.path)
+        closed = False
+
+        while not closed:
+            batch = self.__next_batch()
+            closed = batch[-1] is None
+            records = [astuple(record) for record in batch if record is not None]
+
+            # A failed batch is dropped but the thread keeps draining, so flush and close never hang
+            try:
+                if records:
+                    with connection:
+                        connection.executemany(f"INSERT INTO games ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)", records)
+            except sqlite3.Error as error:
+                self.error = error
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+
+        connection.close()
+
+    def count(self, max_tile=None):
+        query, params = self.__filter("SELECT COUNT(*) FROM games", max_tile)
+        return self.connection.execute(query, params).fetchone()[0]
+
+    def top(self, n=10, max_tile=None):
+        query, params = self.__filter(f"SELECT {COLUMNS} FROM games", max_tile)
+        rows = self.connection.execute(f"{query} ORDER BY score DESC LIMIT ?", params + (n,))
+        return [GameRecord(*row) for row in rows]
+
+    def percentile(self, percent, max_tile=None):
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+
+        count = self.count(max_tile)
+        if count == 0:
+            return None
+
+        # Nearest rank, read straight off the score index; multiply first so whole percents stay exact
+        offset = max(math.ceil(percent * count / 100) - 1, 0)
+        query, params = self.__filter("SELECT score FROM games", max_tile)
+        row = self.connection.execute(f"{query} ORDER BY score LIMIT 1 OFFSET ?", params + (offset,))
+        return row.fetchone()[0]
+
+    def by_max_tile(self):
+        rows = self.connection.execute(
+            "SELECT max_tile, COUNT(*), MAX(score), AVG(score) FROM games GROUP BY max_tile ORDER BY max_tile"
+        )
+        return [MaxTileSummary(*row) for row in rows]
+
+    @staticmethod
+    def __filter(query, max_tile):
+        if max_tile is None:
+            return query, ()
+        return f"{query} WHERE max_tile = ?", (max_tile,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -9,13 +9,13 @@ def get_position_number(row, col):
     return row * conf.game.cols + col
 
 
-def get_random_position(tiles):
+def get_random_position(tiles, rng=random):
     if len(tiles) == conf.game.rows * conf.game.cols:
         raise ValueError("All positions are full")
 
     while True:
-        row = random.randrange(0, conf.game.rows)
-        col = random.randrange(0, conf.game.cols)
+        row = rng.randrange(0, conf.game.rows)
+        col = rng.randrange(0, conf.game.cols)
 
         position_number = get_position_number(row, col)
 
@@ -33,13 +33,20 @@ class Tile:
         self.col = col
 
         self.position_number = get_position_number(row, col)
+        # Cell the tile rests in between moves; its drawn size comes from this cell
+        self.origin = self.position_number
 
         self.x = col * conf.tile.width
         self.y = row * conf.tile.height
 
-    def draw(self, window, font):
+    def draw(self, window, font, rect=None):
         color = Colors.get_tile_color(self.value).value()
-        pygame.draw.rect(window, color, (self.x, self.y, conf.tile.width, conf.tile.height))
+        pygame.draw.rect(window, color, rect or (self.x, self.y, conf.tile.width, conf.tile.height))
+
+        # Keep text off the grid lines, which are baked underneath the tiles
+        clip = window.get_clip()
+        if rect:
+            window.set_clip(rect)
 
         text = font.render(str(self.value), 1, Colors.font.value())
         window.blit(
@@ -49,6 +56,7 @@ class Tile:
                 self.y + (conf.tile.height / 2 - text.get_height() / 2),
             ),
         )
+        window.set_clip(clip)
 
     def set_position_coordinates(self, ceil=False):
         if ceil:
@@ -68,9 +76,9 @@ class Tile:
         return f"Tile(x: {self.row}; y: {self.col}; value: {self.value})"
 
 
-def generate_tiles():
+def generate_tiles(rng=random):
     tiles = {}
     for _ in range(2):
-        row, col, position_number = get_random_position(tiles)
+        row, col, position_number = get_random_position(tiles, rng)
         tiles[position_number] = Tile(2, row, col)
     return tiles
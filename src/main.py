@@ -2,6 +2,7 @@ import pygame
 
 from src.utils.config import conf
 from src.game.engine import game_loop
+from src.game.stats import StatsStore
 
 
 def main():
@@ -11,7 +12,8 @@ def main():
     pygame.display.set_caption(conf.window.title)
     clock = pygame.time.Clock()
 
-    game_loop(window, font, clock)
+    with StatsStore(conf.stats.path) as stats:
+        game_loop(window, font, clock, stats)
 
 
 if __name__ == "__main__":
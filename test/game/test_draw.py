@@ -0,0 +1,102 @@
+import unittest
+
+import pygame
+
+from src.game.draw import BoardLayer, draw, draw_grid
+from src.game.tile import Tile
+from src.utils.colors import Colors
+from src.utils.config import conf
+
+
+class BoardLayerTest(unittest.TestCase):
+    def setUp(self):
+        self.window = pygame.Surface((conf.window.width, conf.window.height))
+        self.layer = BoardLayer()
+
+    def test_layer_is_baked_once(self):
+        surface = self.layer.get(self.window).surface
+        self.assertIs(self.layer.get(self.window).surface, surface)
+
+    def test_layer_rebuilds_on_resize(self):
+        size = (conf.window.width * 2, conf.window.height * 2)
+        layer = self.layer.get(pygame.Surface(size))
+
+        expected = pygame.Surface(size)
+        expected.fill(Colors.background.value())
+        draw_grid(expected)
+
+        outline = Colors.outline.value()
+        cell_width, cell_height = size[0] // conf.game.cols, size[1] // conf.game.rows
+        self.assertEqual(layer.surface.get_size(), size)
+        self.assertEqual(pygame.image.tobytes(layer.surface, "RGB"), pygame.image.tobytes(expected, "RGB"))
+        self.assertEqual(layer.surface.get_at((size[0] - 1, cell_height // 2))[:3], outline)
+        self.assertEqual(layer.surface.get_at((cell_width, cell_height // 2))[:3], outline)
+        self.assertNotEqual(layer.surface.get_at((cell_width // 2, cell_height // 2))[:3], outline)
+        self.assertEqual(layer.cell_rects[-1].bottomright, (size[0] - conf.border.width, size[1] - conf.border.width))
+
+    def test_layer_rebuilds_on_config_change(self):
+        surface = self.layer.get(self.window).surface
+        border_width = conf.border.width
+        try:
+            conf.border.width = border_width + 2
+            self.assertIsNot(self.layer.get(self.window).surface, surface)
+        finally:
+            conf.border.width = border_width
+
+    def test_layer_matches_grid(self):
+        expected = pygame.Surface(self.window.get_size())
+        expected.fill(Colors.background.value())
+        draw_grid(expected)
+
+        baked = self.layer.get(self.window).surface
+        self.assertEqual(pygame.image.tobytes(baked, "RGB"), pygame.image.tobytes(expected, "RGB"))
+
+    def test_cell_rects_cover_only_cell_interiors(self):
+        layer = self.layer.get(self.window)
+        self.assertEqual(len(layer.cell_rects), conf.game.rows * conf.game.cols)
+
+        outline = Colors.outline.value()
+        for rect in layer.cell_rects:
+            with self.subTest(rect=rect):
+                self.assertNotEqual(layer.surface.get_at(rect.topleft)[:3], outline)
+                self.assertNotEqual(layer.surface.get_at((rect.right - 1, rect.bottom - 1))[:3], outline)
+                self.assertEqual(layer.surface.get_at((rect.left - 1, rect.top - 1))[:3], outline)
+                self.assertEqual(layer.surface.get_at((rect.right, rect.bottom))[:3], outline)
+
+    def test_tile_rect_follows_moving_tile(self):
+        layer = self.layer.get(self.window)
+        tile = Tile(2, 1, 2)
+        tile.move(-7, 0)
+
+        cell_rect = layer.cell_rects[tile.position_number]
+        self.assertEqual(layer.tile_rect(tile).topleft, (cell_rect.x - 7, cell_rect.y))
+
+    def test_tile_rect_keeps_its_size_while_moving(self):
+        layer = self.layer.get(self.window)
+        tile = Tile(2, 1, 1)
+        size = layer.tile_rect(tile).size
+
+        for _ in range(conf.tile.width // conf.move.velocity):
+            tile.move(-conf.move.velocity, 0)
+            tile.set_position_coordinates(ceil=True)
+            with self.subTest(x=tile.x):
+                self.assertEqual(layer.tile_rect(tile).size, size)
+
+        self.assertEqual(tile.col, 0)
+
+    def test_tile_text_does_not_cover_grid(self):
+        pygame.font.init()
+        font = pygame.font.SysFont(conf.font.name, conf.tile.height * 2, bold=True)
+        tile = Tile(512, 1, 1)
+
+        draw(self.window, font, {tile.position_number: tile}, update=False)
+
+        layer = self.layer.get(self.window)
+        rect = layer.tile_rect(tile)
+        for point in [(rect.left - 1, rect.centery), (rect.right, rect.centery), (rect.centerx, rect.top - 1)]:
+            with self.subTest(point=point):
+                self.assertEqual(self.window.get_at(point), layer.surface.get_at(point))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
+import random
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from src.game.engine import Game
+import pygame
+
+from src.game.engine import Game, get_events, game_loop, new_game
 from src.game.tile import generate_tiles, Tile
 from src.utils.config import conf
 
@@ -92,5 +95,97 @@ class GamePygameTest(unittest.TestCase):
         self.assertFalse(self.game.has_lost())
 
 
+class NewGameTest(unittest.TestCase):
+    def create_game(self, seed):
+        return new_game(MockSurface(), MagicMock(), MagicMock(), seed=seed)
+
+    def test_same_seed_gives_same_tiles(self):
+        first, second = self.create_game(11), self.create_game(11)
+
+        self.assertEqual(str(first), str(second))
+        first.has_lost()
+        second.has_lost()
+        self.assertEqual(str(first), str(second))
+
+    def test_does_not_reseed_global_random(self):
+        random.seed(3)
+        expected = random.random()
+
+        random.seed(3)
+        self.create_game(11)
+        self.assertEqual(random.random(), expected)
+
+
+class GetEventsTest(unittest.TestCase):
+    def setUp(self):
+        self.event_driven = conf.game.event_driven
+
+    def tearDown(self):
+        conf.game.event_driven = self.event_driven
+
+    @patch("src.game.engine.pygame.event")
+    def test_polls_when_not_event_driven(self, event):
+        conf.game.event_driven = False
+        event.get.return_value = []
+
+        self.assertEqual(get_events(redraw=False), [])
+        event.wait.assert_not_called()
+
+    @patch("src.game.engine.pygame.event")
+    def test_waits_when_idle_and_event_driven(self, event):
+        conf.game.event_driven = True
+        event.wait.return_value = "key"
+        event.get.return_value = ["other"]
+
+        self.assertEqual(get_events(redraw=False), ["key", "other"])
+        event.wait.assert_called_once()
+
+    @patch("src.game.engine.pygame.event")
+    def test_does_not_wait_with_pending_redraw(self, event):
+        conf.game.event_driven = True
+        event.get.return_value = []
+
+        get_events(redraw=True)
+        event.wait.assert_not_called()
+
+
+@patch("src.game.engine.pygame.quit")
+@patch("src.game.engine.game_event_helper", return_value=False)
+@patch("src.game.engine.draw")
+@patch("src.game.engine.pygame.event")
+class GameLoopTest(unittest.TestCase):
+    def setUp(self):
+        self.event_driven = conf.game.event_driven
+        self.key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
+        self.idle = pygame.event.Event(pygame.MOUSEMOTION)
+        self.quit = pygame.event.Event(pygame.QUIT)
+
+    def tearDown(self):
+        conf.game.event_driven = self.event_driven
+
+    def run_loop(self):
+        game_loop(MockSurface(), MagicMock(), MagicMock())
+
+    def test_event_driven_loop_draws_only_on_state_changes(self, event, draw, *_):
+        conf.game.event_driven = True
+        event.get.return_value = []
+        event.wait.side_effect = [self.key, self.idle, self.idle, self.quit]
+
+        self.run_loop()
+
+        # Once for the first frame and once after the key press
+        self.assertEqual(draw.call_count, 2)
+        self.assertEqual(event.wait.call_count, 4)
+
+    def test_polling_loop_draws_every_frame(self, event, draw, *_):
+        conf.game.event_driven = False
+        event.get.side_effect = [[], [self.key], [self.idle], [self.idle], [self.quit]]
+
+        self.run_loop()
+
+        self.assertEqual(draw.call_count, 4)
+        event.wait.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+import io
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.game.direction import Direction
+from src.game.draw import draw
+from src.game.render import init_headless, render_game, FrameWriter, PngFrameWriter, RawFrameWriter
+
+
+class ListFrameWriter(FrameWriter):
+    def __init__(self, size):
+        super().__init__(size)
+        self.encoded = []
+
+    def encode(self, frame, index):
+        self.encoded.append((index, frame))
+
+
+class FailingFrameWriter(FrameWriter):
+    def encode(self, frame, index):
+        raise IOError("disk full")
+
+
+class RenderGameTest(unittest.TestCase):
+    def setUp(self):
+        self.window, self.font = init_headless()
+        self.size = self.window.get_size()
+        self.frame_size = self.size[0] * self.size[1] * 3
+
+    def test_render_game_streams_frames_in_order(self):
+        with ListFrameWriter(self.size) as writer:
+            render_game(self.window, self.font, writer, seed=1, max_moves=5)
+
+        self.assertGreater(len(writer.encoded), 1)
+        self.assertEqual([index for index, _ in writer.encoded], list(range(len(writer.encoded))))
+        for _, frame in writer.encoded:
+            self.assertEqual(len(frame), self.frame_size)
+
+    def test_render_game_replays_moves(self):
+        moves = [Direction.LEFT, Direction.UP, Direction.RIGHT, Direction.DOWN]
+
+        with ListFrameWriter(self.size) as first:
+            render_game(self.window, self.font, first, moves, seed=7)
+        with ListFrameWriter(self.size) as second:
+            render_game(self.window, self.font, second, moves, seed=7)
+
+        self.assertEqual(first.encoded, second.encoded)
+
+    def test_render_game_shows_spawned_tile_in_last_frame(self):
+        with ListFrameWriter(self.size) as writer:
+            game, has_lost = render_game(self.window, self.font, writer, [Direction.LEFT], seed=5)
+
+        self.assertFalse(has_lost)
+        self.assertEqual(len(game.tiles), 3)
+
+        expected = pygame.Surface(self.size)
+        draw(expected, self.font, game.tiles, update=False)
+        self.assertEqual(writer.encoded[-1][1], pygame.image.tobytes(expected, "RGB"))
+        self.assertNotEqual(writer.encoded[-1][1], writer.encoded[-2][1])
+
+    def test_frame_writer_requires_encode(self):
+        with self.assertRaises(TypeError):
+            FrameWriter(self.size)
+
+    def test_raw_frame_writer_writes_rgb_buffers(self):
+        stream = io.BytesIO()
+        with RawFrameWriter(stream, self.size) as writer:
+            render_game(self.window, self.font, writer, seed=3, max_moves=1)
+
+        self.assertEqual(len(stream.getvalue()), writer.count * self.frame_size)
+
+    def test_png_frame_writer_writes_numbered_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with PngFrameWriter(directory, self.size) as writer:
+                render_game(self.window, self.font, writer, seed=3, max_moves=1)
+
+            files = sorted(os.listdir(directory))
+            self.assertEqual(files, [f"frame_{index:06d}.png" for index in range(writer.count)])
+
+    def test_frame_writer_raises_encoding_errors_on_close(self):
+        writer = FailingFrameWriter(self.size)
+        writer.start()
+        writer.write(self.window)
+
+        with self.assertRaises(IOError):
+            writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.game.engine import Game
+from src.game.stats import GameRecord, StatsStore, MaxTileSummary
+from src.game.tile import Tile
+
+
+class GameRecordTest(unittest.TestCase):
+
+    def test_from_game_uses_game_progress(self):
+        tiles = {0: Tile(2, 0, 0), 5: Tile(64, 1, 1), 10: Tile(8, 2, 2)}
+        game = Game(MagicMock(), MagicMock(), MagicMock(), tiles, seed=42)
+        game.score = 120
+        game.moves = 17
+
+        record = GameRecord.from_game(game)
+
+        self.assertEqual(record.score, 120)
+        self.assertEqual(record.max_tile, 64)
+        self.assertEqual(record.moves, 17)
+        self.assertEqual(record.seed, 42)
+        self.assertGreaterEqual(record.duration, 0)
+
+
+class StatsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "stats.db")
+        self.store = StatsStore(self.path, batch_size=8, flush_interval=0.05)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def record_games(self, scores_and_tiles):
+        for seed, (score, max_tile) in enumerate(scores_and_tiles):
+            self.store.record(GameRecord(score, max_tile, 10, 1.5, seed))
+        self.store.flush()
+
+    def test_records_are_written_in_batches(self):
+        self.record_games([(score, 128) for score in range(20)])
+        self.assertEqual(self.store.count(), 20)
+
+    def test_failed_batch_does_not_stop_the_writer(self):
+        self.store.record(GameRecord(None, 16, 10, 1.5, 0))
+        self.store.flush()
+        self.assertIsInstance(self.store.error, sqlite3.IntegrityError)
+
+        self.record_games([(100, 16)])
+        self.assertEqual(self.store.count(), 1)
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.store.close()
+        self.store = StatsStore(self.path)
+
+    def test_records_survive_reopening(self):
+        self.record_games([(100, 16), (200, 32)])
+        self.store.close()
+
+        self.store = StatsStore(self.path)
+        self.assertEqual(self.store.count(), 2)
+
+    def test_top_returns_highest_scores_first(self):
+        self.record_games([(300, 32), (100, 16), (500, 64), (200, 32)])
+
+        top = self.store.top(2)
+
+        self.assertEqual([record.score for record in top], [500, 300])
+        self.assertEqual(top[0].max_tile, 64)
+        self.assertEqual(top[0].seed, 2)
+
+    def test_top_filters_by_max_tile(self):
+        self.record_games([(300, 32), (100, 16), (500, 64), (200, 32)])
+        self.assertEqual([record.score for record in self.store.top(5, max_tile=32)], [300, 200])
+
+    def test_percentile(self):
+        self.record_games([(score, 16) for score in range(0, 101, 10)])
+
+        self.assertEqual(self.store.percentile(0), 0)
+        self.assertEqual(self.store.percentile(50), 50)
+        self.assertEqual(self.store.percentile(90), 90)
+        self.assertEqual(self.store.percentile(100), 100)
+
+    def test_percentile_with_even_number_of_games(self):
+        self.record_games([(score, 16) for score in [40, 10, 30, 20]])
+
+        self.assertEqual(self.store.percentile(0), 10)
+        self.assertEqual(self.store.percentile(25), 10)
+        self.assertEqual(self.store.percentile(50), 20)
+        self.assertEqual(self.store.percentile(75), 30)
+        self.assertEqual(self.store.percentile(100), 40)
+
+    def test_percentile_of_hundred_games_is_exact(self):
+        self.record_games([(score, 16) for score in range(100, 0, -1)])
+
+        for percent in [1, 7, 14, 28, 29, 57, 58, 99, 100]:
+            with self.subTest(percent=percent):
+                self.assertEqual(self.store.percentile(percent), percent)
+
+    def test_percentile_out_of_range(self):
+        for percent in [-1, 150]:
+            with self.subTest(percent=percent):
+                with self.assertRaises(ValueError):
+                    self.store.percentile(percent)
+
+    def test_percentile_without_games(self):
+        self.assertIsNone(self.store.percentile(50))
+
+    def test_by_max_tile(self):
+        self.record_games([(300, 32), (100, 16), (500, 64), (200, 32)])
+
+        self.assertEqual(self.store.by_max_tile(), [
+            MaxTileSummary(16, 1, 100, 100.0),
+            MaxTileSummary(32, 2, 300, 250.0),
+            MaxTileSummary(64, 1, 500, 500.0),
+        ])
+
+    def test_queries_use_indexes(self):
+        plan = self.store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT score FROM games WHERE max_tile = ? ORDER BY score DESC LIMIT 10", (32,)
+        ).fetchall()
+        self.assertIn("games_max_tile_score", str(plan))
+
+
+if __name__ == '__main__':
+    unittest.main()